@@ -1,170 +1,276 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from expenses import ExpenseTracker, ExpenseValidationError
+from expenses import ExpenseTracker, ExpenseValidationError, warm_up_kernels
+from persistence import PersistenceWorker
 import json
 from datetime import datetime
+from typing import Any, Union
+import atexit
 import logging
+import os
+import orjson
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.json."""
+
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's bytes to the response as-is; the default
+        # implementation goes through dumps() and re-encodes the str.
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.option), mimetype="application/json"
+        )
+
+
+class ORJSONResponse(Response):
+    default_mimetype = "application/json"
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Initialize expense tracker in memory
 tracker = ExpenseTracker()
+# Mutations go through the worker, which logs them to disk in the background
+persistence = PersistenceWorker(tracker, "expenses.json", "expenses.log")
+
+# Expense lists at least this long are streamed in chunks of STREAM_CHUNK rows
+# instead of being built as one list of dicts before encoding.
+STREAM_THRESHOLD = 5000
+STREAM_CHUNK = 500
+
+# ETags combine this per-process token with the tracker version, so a tag
+# issued before a restart (when the version starts over) never matches.
+_ETAG_PREFIX = os.urandom(4).hex()
+
+# Fixed bodies for the delete endpoint, encoded once at import. Only the bytes
+# are shared: Response objects are mutated per request (CORS, ETag headers).
+_INVALID_ID_BODY = orjson.dumps({"error": "Invalid expense ID format"})
+_NOT_FOUND_BODY = orjson.dumps({"error": "Expense not found"})
+_DELETED_BODY = orjson.dumps({"message": "Expense deleted successfully"})
+
+
+def _join_expenses(expenses):
+    """Comma-joined JSON of the expenses, from their pre-encoded rows."""
+    return b",".join([e.to_json() for e in expenses])
+
+
+def _expenses_json(expenses):
+    """JSON array of the expenses; a byte copy, since rows are pre-encoded."""
+    return b"[" + _join_expenses(expenses) + b"]"
+
+
+def _json(obj):
+    """Encode obj straight to a JSON response body with orjson."""
+    return ORJSONResponse(orjson.dumps(obj, option=OrjsonProvider.option))
+
+
+def _cached_json(key, build):
+    """Serve build() as JSON, reusing the encoded body until expenses change."""
+    body = tracker.get_cached(
+        key, lambda: orjson.dumps(build(), option=OrjsonProvider.option)
+    )
+    return ORJSONResponse(body)
+
+
+def _conditional(respond):
+    """Answer 304 if the client already has the current version, else respond().
+
+    The version is read before respond() builds the body, so the ETag can
+    only be older than the body it labels, never newer.
+    """
+    etag = f"{_ETAG_PREFIX}-{tracker.version}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = respond()
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def _stream_expenses(expenses, version):
+    """Yield the JSON array chunk by chunk, caching the full body at the end."""
+    chunks = []
+    for start in range(0, len(expenses), STREAM_CHUNK):
+        chunk = _join_expenses(expenses[start : start + STREAM_CHUNK])
+        chunk = (b"," if chunks else b"[") + chunk
+        chunks.append(chunk)
+        yield chunk
+    tail = b"]" if chunks else b"[]"
+    chunks.append(tail)
+    yield tail
+    tracker.set_cached("expenses", b"".join(chunks), version)
 
 
 @app.route("/api/expenses", methods=["GET"])
 def get_expenses():
     """Get all expenses"""
-    expenses = []
-    for expense in tracker.list_expenses():
-        expenses.append(
-            {
-                "id": f"{expense.date.isoformat()}_{expense.category.name}_{expense.amount}",
-                "category": expense.category.name,
-                "amount": expense.amount,
-                "date": expense.date.isoformat(),
-                "description": expense.description or "",
-            }
-        )
-    return jsonify(expenses)
+    return _conditional(_expenses_response)
+
+
+def _expenses_response():
+    body = tracker.peek_cached("expenses")
+    if body is None and len(tracker.expenses) >= STREAM_THRESHOLD:
+        # The generator runs after this handler returns, so hand it a copy.
+        # Reading the version first means a concurrent change is never cached.
+        version = tracker.version
+        return ORJSONResponse(_stream_expenses(tracker.snapshot_expenses(), version))
+    body = tracker.get_cached("expenses", lambda: _expenses_json(tracker.expenses))
+    return ORJSONResponse(body)
 
 
 @app.route("/api/expenses", methods=["POST"])
 def add_expense():
     """Add a new expense"""
-    data = request.json
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return _json({"error": "Request body must be valid JSON"}), 400
 
-    if not data or "category" not in data or "amount" not in data or "date" not in data:
+    if isinstance(data, dict):
+        category = data.get("category")
+        amount = data.get("amount")
+        date_str = data.get("date")
+    else:
+        category = amount = date_str = None
+    if category is None or amount is None or date_str is None:
         return (
-            jsonify({"error": "Missing required fields: category, amount, date"}),
+            _json({"error": "Missing required fields: category, amount, date"}),
             400,
         )
 
     try:
-        expense = tracker.add_expense(
-            category=data["category"],
-            amount=float(data["amount"]),
-            date_str=data["date"],
+        expense = persistence.add_expense(
+            category=category,
+            amount=amount,
+            date_str=date_str,
             description=data.get("description"),
         )
-
-        # Save to file immediately after adding
-        try:
-            tracker.save_to_file("expenses.json")
-            logger.info(
-                f"Expense added and saved to file: {data['category']} - ${data['amount']}"
-            )
-        except Exception as e:
-            logger.error(f"Error saving expense to file: {e}")
+        logger.info("Expense added: %s - $%s", category, amount)
 
         # Return the created expense
-        return (
-            jsonify(
-                {
-                    "id": f"{expense.date.isoformat()}_{expense.category.name}_{expense.amount}",
-                    "category": expense.category.name,
-                    "amount": expense.amount,
-                    "date": expense.date.isoformat(),
-                    "description": expense.description or "",
-                }
-            ),
-            201,
-        )
+        return ORJSONResponse(expense.to_json()), 201
+    except ExpenseValidationError as e:
+        return _json({"error": str(e)}), 400
+
+
+@app.route("/api/expenses/bulk", methods=["POST"])
+def add_expenses_bulk():
+    """Add a list of expenses in one request, all or nothing"""
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return _json({"error": "Request body must be valid JSON"}), 400
+
+    if not isinstance(data, list):
+        return _json({"error": "Request body must be a list of expenses"}), 400
+    if not data:
+        return ORJSONResponse(b"[]"), 201
+    for i, item in enumerate(data):
+        if (
+            not isinstance(item, dict)
+            or item.get("category") is None
+            or item.get("amount") is None
+            or item.get("date") is None
+        ):
+            error = f"Item {i}: missing required fields: category, amount, date"
+            return _json({"error": error}), 400
+
+    try:
+        expenses = persistence.add_expenses(data)
     except ExpenseValidationError as e:
-        return jsonify({"error": str(e)}), 400
+        return _json({"error": str(e)}), 400
+    logger.info("Bulk added %d expenses", len(expenses))
+    return ORJSONResponse(_expenses_json(expenses)), 201
 
 
 @app.route("/api/expenses/<expense_id>", methods=["DELETE"])
 def delete_expense(expense_id):
     """Delete an expense by ID"""
-    try:
-        # Parse the ID format: date_category_amount
-        parts = expense_id.split("_")
-        if len(parts) < 3:
-            return jsonify({"error": "Invalid expense ID format"}), 400
-
-        date_str = parts[0]
-        category = "_".join(parts[1:-1])  # Handle categories with underscores
-        amount = float(parts[-1])
-
-        # Find and remove the expense
-        for expense in tracker.expenses:
-            if (
-                expense.date.isoformat() == date_str
-                and expense.category.name == category
-                and expense.amount == amount
-            ):
-                if tracker.remove_expense(expense):
-                    # Save to file immediately after deleting
-                    try:
-                        tracker.save_to_file("expenses.json")
-                        logger.info(
-                            f"Expense deleted and saved to file: {expense.category.name} - ${expense.amount}"
-                        )
-                    except Exception as e:
-                        logger.error(f"Error saving after deletion to file: {e}")
-                    return jsonify({"message": "Expense deleted successfully"}), 200
-
-        return jsonify({"error": "Expense not found"}), 404
-    except (ValueError, IndexError) as e:
-        return jsonify({"error": "Invalid expense ID format"}), 400
+    expense = persistence.remove_by_id(expense_id)
+    if expense is None:
+        # Ids have the form date_category_amount; tell malformed ids apart
+        # from unknown ones without scanning the expenses.
+        try:
+            _, rest = expense_id.split("_", 1)
+            _, amount_str = rest.rsplit("_", 1)
+            float(amount_str)
+        except ValueError:
+            return ORJSONResponse(_INVALID_ID_BODY), 400
+        return ORJSONResponse(_NOT_FOUND_BODY), 404
+
+    logger.info("Expense deleted: %s - $%s", expense.category.name, expense.amount)
+    return ORJSONResponse(_DELETED_BODY), 200
+
+
+@app.route("/api/compact", methods=["POST"])
+def compact_storage():
+    """Fold the change log into expenses.json"""
+    persistence.request_compaction()
+    return _json({"message": "Compaction scheduled"}), 202
 
 
 @app.route("/api/statistics", methods=["GET"])
 def get_statistics():
     """Get expense statistics"""
-    stats = tracker.get_statistics()
-    return jsonify(stats)
+    return _conditional(lambda: _cached_json("statistics_json", tracker.get_statistics))
 
 
 @app.route("/api/expenses/category/<category>", methods=["GET"])
 def get_expenses_by_category(category):
     """Get expenses for a specific category"""
-    expenses = []
-    for expense in tracker.get_expenses_by_category(category):
-        expenses.append(
-            {
-                "id": f"{expense.date.isoformat()}_{expense.category.name}_{expense.amount}",
-                "category": expense.category.name,
-                "amount": expense.amount,
-                "date": expense.date.isoformat(),
-                "description": expense.description or "",
-            }
-        )
-    return jsonify(expenses)
+    return ORJSONResponse(_expenses_json(tracker.get_expenses_by_category(category)))
 
 
 @app.route("/api/categories", methods=["GET"])
 def get_categories():
     """Get all categories with statistics"""
-    category_stats = tracker.get_category_statistics()
-    all_categories = tracker.get_all_categories()
-
-    return jsonify(
-        {
-            "categories": [cat.to_dict() for cat in all_categories],
-            "category_statistics": category_stats,
-        }
+    return _cached_json(
+        "categories",
+        lambda: {
+            "categories": [cat.to_dict() for cat in tracker.get_all_categories()],
+            "category_statistics": tracker.get_category_statistics(),
+        },
     )
 
 
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "message": "Expense Tracker API is running"})
+    return _json({"status": "healthy", "message": "Expense Tracker API is running"})
 
 
-if __name__ == "__main__":
+def init_storage():
+    """Load saved expenses, replay the change log and start the persistence worker."""
+    warm_up_kernels()
     try:
         tracker.load_from_file("expenses.json")
         logger.info("Loaded existing expenses from file")
     except FileNotFoundError:
         logger.info("No existing expenses file found, starting with empty tracker")
-    except Exception as e:
-        logger.error(f"Error loading expenses: {e}")
+    # Any other load error stops startup: carrying on with an empty tracker
+    # would let the first compaction overwrite expenses.json.
 
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    persistence.replay()
+    persistence.start()
+    atexit.register(persistence.stop)
+
+
+if __name__ == "__main__":
+    init_storage()
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1", host="0.0.0.0", port=5000)
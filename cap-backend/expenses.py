@@ -1,27 +1,92 @@
 from datetime import datetime, date
 from collections import defaultdict
-from typing import List, Tuple, Optional, Dict, Any
-from decimal import Decimal, InvalidOperation
-import json
+from typing import Callable, List, Sequence, Tuple, Optional, Dict, Any
+import bisect
 import logging
+import math
+import os
+import threading
+from operator import attrgetter, itemgetter
+import numpy as np
+import orjson
+from numba import njit
 
 
 logger = logging.getLogger(__name__)
 
+# Sort key for the date-ordered expense lists; attrgetter runs in C.
+_date_key = attrgetter("date")
+
+# Many expenses share a date, so each date is formatted once and the string
+# reused. Racing writers store equal values, so no lock is needed.
+_ISO_CACHE: Dict[date, str] = {}
+
+
+def _iso(d: date) -> str:
+    s = _ISO_CACHE.get(d)
+    if s is None:
+        s = _ISO_CACHE[d] = d.isoformat()
+    return s
+
+
+# Below this many expenses a plain Python pass beats the compiled kernel's
+# dispatch overhead.
+VECTORIZE_THRESHOLD = 512
+
+
+@njit(cache=True)
+def _category_stats_kernel(amounts, codes, n_categories):
+    sums = np.zeros(n_categories)
+    counts = np.zeros(n_categories, np.int64)
+    mins = np.full(n_categories, np.inf)
+    maxs = np.full(n_categories, -np.inf)
+    for i in range(amounts.shape[0]):
+        a = amounts[i]
+        c = codes[i]
+        sums[c] += a
+        counts[c] += 1
+        if a < mins[c]:
+            mins[c] = a
+        if a > maxs[c]:
+            maxs[c] = a
+    return sums, counts, mins, maxs
+
+
+def warm_up_kernels() -> None:
+    """Compile (or load from the on-disk cache) the numba kernels now.
+
+    Otherwise the first large statistics request pays the JIT cost.
+    """
+    _category_stats_kernel(
+        np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int32), 0
+    )
+
 
 class ExpenseValidationError(Exception):
     """Raised when expense data validation fails."""
 
-    def __init__(self, message: str, field: Optional[str] = None, value: Any = None):
+    def __init__(
+        self,
+        message: str,
+        field: Optional[str] = None,
+        value: Any = None,
+        index: Optional[int] = None,
+    ):
         self.message = message
         self.field = field
         self.value = value
+        # Position of the offending item when validating a batch.
+        self.index = index
         super().__init__(self.message)
 
     def __str__(self) -> str:
         if self.field:
-            return f"Validation error in field '{self.field}': {self.message}"
-        return f"Validation error: {self.message}"
+            text = f"Validation error in field '{self.field}': {self.message}"
+        else:
+            text = f"Validation error: {self.message}"
+        if self.index is not None:
+            return f"Item {self.index}: {text}"
+        return text
 
 
 class CategoryError(Exception):
@@ -39,6 +104,8 @@ class CategoryError(Exception):
 
 
 class Category:
+    __slots__ = ("name", "description", "color")
+
     def __init__(
         self, name: str, description: Optional[str] = None, color: Optional[str] = None
     ):
@@ -75,6 +142,17 @@ class Category:
 
 
 class Expense:
+    __slots__ = (
+        "category",
+        "amount",
+        "date",
+        "description",
+        "_iso_date",
+        "_id",
+        "_dict",
+        "_json",
+    )
+
     def __init__(
         self,
         category: str,
@@ -85,46 +163,94 @@ class Expense:
         self.category = self._validate_and_create_category(category)
         self.amount = self._validate_amount(amount)
         self.date = self._validate_date(date_str)
-        self.description = description.strip() if description else None
+        self.description = self._validate_description(description)
+        # Fields never change after construction, so derived values are
+        # computed once here instead of on every serialization.
+        self._iso_date = _iso(self.date)
+        self._id = f"{self._iso_date}_{self.category.name}_{self.amount}"
+        self._dict = {
+            "category": self.category.name,
+            "amount": self.amount,
+            "date": self._iso_date,
+            "description": self.description,
+        }
+        self._json = orjson.dumps(
+            {
+                "id": self._id,
+                "category": self.category.name,
+                "amount": self.amount,
+                "date": self._iso_date,
+                "description": self.description or "",
+            }
+        )
+
+    @property
+    def id(self) -> str:
+        """Identifier used by the API: date_category_amount."""
+        return self._id
+
+    @property
+    def iso_date(self) -> str:
+        return self._iso_date
 
     @staticmethod
     def _validate_and_create_category(category: str) -> Category:
-        if not category or not category.strip():
+        if not isinstance(category, str):
+            raise ExpenseValidationError(
+                "Category must be a string", field="category", value=category
+            )
+        if not category.strip():
             raise ExpenseValidationError(
                 "Category cannot be empty", field="category", value=category
             )
         return Category(name=category.strip())
 
+    @staticmethod
+    def _validate_description(description: Optional[str]) -> Optional[str]:
+        if description is None:
+            return None
+        if not isinstance(description, str):
+            raise ExpenseValidationError(
+                "Description must be a string", field="description", value=description
+            )
+        return description.strip() if description else None
+
     @staticmethod
     def _validate_amount(amount: float) -> float:
         try:
-            amount_decimal = Decimal(str(amount))
-            if amount_decimal <= 0:
-                raise ExpenseValidationError(
-                    "Amount must be positive", field="amount", value=amount
-                )
-            return float(amount_decimal)
-        except (InvalidOperation, ValueError):
+            if isinstance(amount, bool):
+                raise TypeError(amount)
+            value = float(amount)
+        except (TypeError, ValueError):
+            raise ExpenseValidationError(
+                "Invalid amount format", field="amount", value=amount
+            )
+        if not math.isfinite(value):
             raise ExpenseValidationError(
                 "Invalid amount format", field="amount", value=amount
             )
+        if value <= 0:
+            raise ExpenseValidationError(
+                "Amount must be positive", field="amount", value=amount
+            )
+        return value
 
     @staticmethod
     def _validate_date(date_str: str) -> date:
         try:
             return datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
+        except (TypeError, ValueError):
             raise ExpenseValidationError(
                 "Date must be in YYYY-MM-DD format", field="date", value=date_str
             )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "category": self.category.name,
-            "amount": self.amount,
-            "date": self.date.isoformat(),
-            "description": self.description,
-        }
+        """Serializable form of the expense; shared, so treat it as read-only."""
+        return self._dict
+
+    def to_json(self) -> bytes:
+        """API representation of the expense (with its id), encoded once."""
+        return self._json
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Expense":
@@ -148,18 +274,118 @@ class Expense:
         return hash((self.category, self.amount, self.date))
 
     def __str__(self) -> str:
-        return f"{self.date} | {self.category.name} | ${self.amount:.2f}"
+        return f"{self._iso_date} | {self.category.name} | ${self.amount:.2f}"
 
     def __repr__(self) -> str:
-        return f"Expense(category='{self.category.name}', amount={self.amount}, date='{self.date}', description='{self.description}')"
+        return f"Expense(category='{self.category.name}', amount={self.amount}, date='{self._iso_date}', description='{self.description}')"
+
+
+def _remove_sorted(expenses: List[Expense], expense: Expense) -> None:
+    """Delete expense (by identity) from a list kept sorted by date."""
+    i = bisect.bisect_left(expenses, expense.date, key=_date_key)
+    while expenses[i] is not expense:
+        i += 1
+    del expenses[i]
+
+
+class _ExpenseColumns:
+    """Structure-of-arrays copy of expense amounts and category codes.
+
+    Rows are appended into doubling buffers and removed by moving the
+    last row into the freed slot, so both operations are O(1).
+    """
+
+    def __init__(self):
+        self.amounts = np.empty(64, dtype=np.float64)
+        self.codes = np.empty(64, dtype=np.int32)
+        self.size = 0
+        self.category_names: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self._rows: List[Expense] = []
+        self._slots: Dict[int, int] = {}
+
+    def append(self, expense: Expense) -> None:
+        if self.size == len(self.amounts):
+            self.amounts = np.resize(self.amounts, 2 * self.size)
+            self.codes = np.resize(self.codes, 2 * self.size)
+        code = self._category_codes.get(expense.category.name)
+        if code is None:
+            code = self._category_codes[expense.category.name] = len(
+                self.category_names
+            )
+            self.category_names.append(expense.category.name)
+
+        self.amounts[self.size] = expense.amount
+        self.codes[self.size] = code
+        self._slots[id(expense)] = self.size
+        self._rows.append(expense)
+        self.size += 1
+
+    def remove(self, expense: Expense) -> None:
+        slot = self._slots.pop(id(expense))
+        last = self.size - 1
+        if slot != last:
+            moved = self._rows[last]
+            self.amounts[slot] = self.amounts[last]
+            self.codes[slot] = self.codes[last]
+            self._rows[slot] = moved
+            self._slots[id(moved)] = slot
+        self._rows.pop()
+        self.size = last
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def category_statistics(self) -> Dict[str, Tuple[float, int, float, float]]:
+        """(total, count, min, max) for every non-empty category, in one pass."""
+        totals, counts, mins, maxs = _category_stats_kernel(
+            self.amounts[: self.size],
+            self.codes[: self.size],
+            len(self.category_names),
+        )
+        return {
+            self.category_names[i]: (total, count, low, high)
+            for i, (total, count, low, high) in enumerate(
+                zip(totals.tolist(), counts.tolist(), mins.tolist(), maxs.tolist())
+            )
+            if count
+        }
 
 
 class ExpenseTracker:
     def __init__(self):
+        # Kept sorted by date so list_expenses() never has to re-sort.
         self._expenses: List[Expense] = []
+        # Expenses that compare equal share an id, so each id maps to a list.
+        self._by_id: Dict[str, List[Expense]] = {}
+        # Date-ordered expenses per case-folded category name.
+        self._by_category: Dict[str, List[Expense]] = defaultdict(list)
+        self._columns = _ExpenseColumns()
+        # Running aggregates, updated on every add/remove.
+        self._total = 0.0
+        self._category_totals: Dict[str, float] = defaultdict(float)
+        self._category_counts: Dict[str, int] = defaultdict(int)
+        self._date_totals: Dict[str, float] = defaultdict(float)
+        self._date_counts: Dict[str, int] = defaultdict(int)
+        self._cache: Dict[str, Any] = {}
+        # Bumped on every change; lets callers tell whether cached data is stale.
+        self._version = 0
+        # (path, mtime_ns, version) of the file the expenses last matched.
+        self._file_state: Optional[Tuple[str, int, int, int]] = None
+        # Sequence number of the last change-log record reflected in the
+        # expenses. PersistenceWorker maintains it; snapshots store it so a
+        # replay can skip records the snapshot already contains.
+        self.log_seq = 0
+        # Serializes mutations and cache rebuilds across request threads.
+        self._lock = threading.RLock()
 
     @property
-    def expenses(self) -> List[Expense]:
+    def expenses(self) -> Sequence[Expense]:
+        """Read-only, date-ordered view of the expenses; do not mutate."""
+        return self._expenses
+
+    def snapshot_expenses(self) -> List[Expense]:
+        """Copy of the expenses, safe to keep across later changes."""
         return self._expenses.copy()
 
     def add_expense(
@@ -171,62 +397,214 @@ class ExpenseTracker:
     ) -> Expense:
         try:
             expense = Expense(category, amount, date_str, description)
-            self._expenses.append(expense)
-            logger.info(f"Added expense: {expense}")
+            with self._lock:
+                bisect.insort(self._expenses, expense, key=_date_key)
+                self._index(expense)
+                self._invalidate_cache()
+            logger.info("Added expense: %s", expense)
             return expense
         except ExpenseValidationError as e:
-            logger.error(f"Failed to add expense: {e}")
+            logger.error("Failed to add expense: %s", e)
             raise
 
+    def add_expenses(self, items: Sequence[Dict[str, Any]]) -> List[Expense]:
+        """Add many expenses, given in to_dict() form, all or nothing.
+
+        Every item is validated before any is added; an invalid one raises
+        ExpenseValidationError naming its position and leaves the tracker
+        unchanged.
+        """
+        expenses = []
+        for i, item in enumerate(items):
+            try:
+                expenses.append(
+                    Expense(
+                        item.get("category"),
+                        item.get("amount"),
+                        item.get("date"),
+                        item.get("description"),
+                    )
+                )
+            except ExpenseValidationError as e:
+                logger.error("Failed to add expense %d of batch: %s", i, e)
+                raise ExpenseValidationError(
+                    e.message, field=e.field, value=e.value, index=i
+                ) from e
+        if not expenses:
+            return expenses
+
+        with self._lock:
+            # The sort is stable, so this orders the batch exactly as adding
+            # it one expense at a time would, in O(n) for a sorted batch.
+            self._expenses.extend(expenses)
+            self._expenses.sort(key=_date_key)
+            for expense in expenses:
+                self._index(expense)
+            self._invalidate_cache()
+        logger.info("Added %d expenses", len(expenses))
+        return expenses
+
     def remove_expense(self, expense: Expense) -> bool:
+        # Resolve to the tracked instance (the oldest equal one) through the
+        # id index, then drop it from the sorted lists by position rather
+        # than with an O(N) chain of __eq__ calls.
+        with self._lock:
+            tracked = self.get_expense_by_id(expense.id)
+            if tracked is None:
+                logger.warning("Expense not found for removal: %s", expense)
+                return False
+            _remove_sorted(self._expenses, tracked)
+            self._unindex(tracked)
+            self._invalidate_cache()
+        logger.info("Removed expense: %s", expense)
+        return True
+
+    def get_expense_by_id(self, expense_id: str) -> Optional[Expense]:
+        bucket = self._by_id.get(expense_id)
+        return bucket[0] if bucket else None
+
+    def remove_by_id(self, expense_id: str) -> Optional[Expense]:
+        """Remove the expense with the given id, returning it if it existed."""
+        expense = self.get_expense_by_id(expense_id)
+        if expense is None:
+            return None
+        self.remove_expense(expense)
+        return expense
+
+    def _index(self, expense: Expense) -> None:
+        self._by_id.setdefault(expense.id, []).append(expense)
+        bisect.insort(
+            self._by_category[expense.category.name.casefold()],
+            expense,
+            key=_date_key,
+        )
+        self._columns.append(expense)
+
+        category, day = expense.category.name, expense.iso_date
+        self._total += expense.amount
+        self._category_totals[category] += expense.amount
+        self._category_counts[category] += 1
+        self._date_totals[day] += expense.amount
+        self._date_counts[day] += 1
+
+    def _unindex(self, expense: Expense) -> None:
+        # expense is always the first, i.e. tracked, entry of its id bucket.
+        bucket = self._by_id[expense.id]
+        del bucket[0]
+        if not bucket:
+            del self._by_id[expense.id]
+        self._columns.remove(expense)
+        folded = expense.category.name.casefold()
+        _remove_sorted(self._by_category[folded], expense)
+        if not self._by_category[folded]:
+            del self._by_category[folded]
+
+        # Drop keys once their last expense is gone rather than keeping
+        # float residue around.
+        category, day = expense.category.name, expense.iso_date
+        self._total = self._total - expense.amount if self._by_id else 0.0
+        self._category_counts[category] -= 1
+        if self._category_counts[category]:
+            self._category_totals[category] -= expense.amount
+        else:
+            del self._category_counts[category], self._category_totals[category]
+        self._date_counts[day] -= 1
+        if self._date_counts[day]:
+            self._date_totals[day] -= expense.amount
+        else:
+            del self._date_counts[day], self._date_totals[day]
+
+    def _rebuild_indexes(self) -> None:
+        self._by_id = {}
+        self._by_category.clear()
+        self._columns.clear()
+        self._total = 0.0
+        self._category_totals.clear()
+        self._category_counts.clear()
+        self._date_totals.clear()
+        self._date_counts.clear()
+        for expense in self._expenses:
+            self._index(expense)
+
+    def get_cached(self, key: str, builder: Callable[[], Any]) -> Any:
+        """Return the value cached under key, calling builder on a miss.
+
+        Cached values are dropped whenever the expenses change.
+        """
         try:
-            self._expenses.remove(expense)
-            logger.info(f"Removed expense: {expense}")
-            return True
-        except ValueError:
-            logger.warning(f"Expense not found for removal: {expense}")
-            return False
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                value = self._cache[key] = builder()
+            return value
+
+    def peek_cached(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def set_cached(self, key: str, value: Any, version: int) -> None:
+        """Cache value under key, unless the expenses changed since version."""
+        # Mutations invalidate under the lock, so checking and storing under
+        # it too means a change can't slip in between the two.
+        with self._lock:
+            if version == self._version:
+                self._cache[key] = value
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _invalidate_cache(self) -> None:
+        self._version += 1
+        self._cache.clear()
 
     def get_total_expense(self) -> float:
-        return sum(exp.amount for exp in self._expenses)
+        return self._total
 
     def get_total_by_category(self) -> Dict[str, float]:
-        category_totals = defaultdict(float)
-        for exp in self._expenses:
-            category_totals[exp.category.name] += exp.amount
-        return dict(category_totals)
+        return dict(self._category_totals)
 
     def get_expense_trend(self) -> Dict[str, float]:
-        trend = defaultdict(float)
-        for exp in self._expenses:
-            trend[exp.date.isoformat()] += exp.amount
-        return dict(sorted(trend.items()))
+        return self.get_cached(
+            "expense_trend", lambda: dict(sorted(self._date_totals.items()))
+        )
+
+    def get_monthly_trend(self) -> Dict[str, float]:
+        """Totals per YYYY-MM, folded from the per-date aggregates."""
+        return self.get_cached("monthly_trend", self._compute_monthly_trend)
+
+    def _compute_monthly_trend(self) -> Dict[str, float]:
+        trend: Dict[str, float] = defaultdict(float)
+        for day, total in self.get_expense_trend().items():
+            trend[day[:7]] += total
+        return dict(trend)
 
     def get_highest_and_lowest_category(self) -> Tuple[Optional[str], Optional[str]]:
-        category_totals = self.get_total_by_category()
-        if not category_totals:
+        # Reads the running totals directly: O(categories), no copy.
+        if not self._category_totals:
             return None, None
 
-        highest = max(category_totals.items(), key=lambda x: x[1])[0]
-        lowest = min(category_totals.items(), key=lambda x: x[1])[0]
+        by_total = itemgetter(1)
+        highest = max(self._category_totals.items(), key=by_total)[0]
+        lowest = min(self._category_totals.items(), key=by_total)[0]
         return highest, lowest
 
-    def list_expenses(self, sort_by_date: bool = True) -> List[Expense]:
-        if sort_by_date:
-            return sorted(self._expenses, key=lambda x: x.date)
+    def list_expenses(self) -> List[Expense]:
+        """All expenses in date order (insertion order among equal dates)."""
+        # _expenses is maintained in date order, so this is just a copy.
         return self._expenses.copy()
 
     def get_expenses_by_category(self, category: str) -> List[Expense]:
-        return [
-            exp
-            for exp in self._expenses
-            if exp.category.name.lower() == category.lower()
-        ]
+        return list(self._by_category.get(category.casefold(), ()))
 
     def get_expenses_by_date_range(
         self, start_date: date, end_date: date
     ) -> List[Expense]:
-        return [exp for exp in self._expenses if start_date <= exp.date <= end_date]
+        lo = bisect.bisect_left(self._expenses, start_date, key=_date_key)
+        hi = bisect.bisect_right(self._expenses, end_date, lo=lo, key=_date_key)
+        return self._expenses[lo:hi]
 
     def get_all_categories(self) -> List[Category]:
         """Get all unique categories used in expenses."""
@@ -237,59 +615,133 @@ class ExpenseTracker:
 
     def get_category_statistics(self) -> Dict[str, Dict[str, Any]]:
         """Get detailed statistics for each category."""
-        category_stats = {}
-        category_totals = self.get_total_by_category()
+        return self.get_cached("category_statistics", self._compute_category_statistics)
 
-        for category_name, total in category_totals.items():
-            category_expenses = self.get_expenses_by_category(category_name)
-            category_stats[category_name] = {
+    def _compute_category_statistics(self) -> Dict[str, Dict[str, Any]]:
+        if len(self._expenses) >= VECTORIZE_THRESHOLD:
+            acc = self._columns.category_statistics()
+        else:
+            acc = self._category_statistics_loop()
+
+        return {
+            name: {
                 "total_amount": total,
-                "expense_count": len(category_expenses),
-                "average_amount": (
-                    total / len(category_expenses) if category_expenses else 0
-                ),
-                "min_amount": (
-                    min(exp.amount for exp in category_expenses)
-                    if category_expenses
-                    else 0
-                ),
-                "max_amount": (
-                    max(exp.amount for exp in category_expenses)
-                    if category_expenses
-                    else 0
-                ),
+                "expense_count": count,
+                "average_amount": total / count,
+                "min_amount": low,
+                "max_amount": high,
             }
+            for name, (total, count, low, high) in acc.items()
+        }
+
+    def _category_statistics_loop(self) -> Dict[str, List[float]]:
+        # One pass over the expenses accumulating [total, count, min, max].
+        acc: Dict[str, List[float]] = {}
+        for exp in self._expenses:
+            s = acc.get(exp.category.name)
+            if s is None:
+                acc[exp.category.name] = [exp.amount, 1, exp.amount, exp.amount]
+                continue
+            s[0] += exp.amount
+            s[1] += 1
+            if exp.amount < s[2]:
+                s[2] = exp.amount
+            elif exp.amount > s[3]:
+                s[3] = exp.amount
+        return acc
+
+    def _matches_file(self, filepath: str, mtime_ns: Optional[int]) -> bool:
+        """Whether the expenses are unchanged since they matched this file."""
+        return self._file_state == (
+            os.path.abspath(filepath),
+            mtime_ns,
+            self._version,
+            self.log_seq,
+        )
 
-        return category_stats
+    def _mark_synced(
+        self, filepath: str, mtime_ns: int, version: int, log_seq: int
+    ) -> None:
+        self._file_state = (os.path.abspath(filepath), mtime_ns, version, log_seq)
 
     def save_to_file(self, filepath: str) -> None:
         try:
-            with open(filepath, "w") as f:
-                json.dump([exp.to_dict() for exp in self._expenses], f, indent=2)
-            logger.info(f"Saved {len(self._expenses)} expenses to {filepath}")
+            mtime_ns = os.stat(filepath).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        # Encode the whole payload up front and hand it to the kernel in one
+        # unbuffered write; a temp file plus os.replace keeps the old
+        # snapshot intact if the write fails halfway.
+        with self._lock:
+            if self._matches_file(filepath, mtime_ns):
+                logger.debug("Expenses unchanged since %s was written", filepath)
+                return
+            version, log_seq = self._version, self.log_seq
+            buf = orjson.dumps(
+                {
+                    "log_seq": log_seq,
+                    "expenses": [exp.to_dict() for exp in self._expenses],
+                }
+            )
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, "wb", buffering=0) as f:
+                f.write(buf)
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+            with self._lock:
+                self._mark_synced(
+                    filepath, os.stat(filepath).st_mtime_ns, version, log_seq
+                )
+            logger.info("Saved %d expenses to %s", len(self._expenses), filepath)
         except (IOError, OSError) as e:
-            logger.error(f"Failed to save expenses to file: {e}")
+            logger.error("Failed to save expenses to file: %s", e)
             raise
 
     def load_from_file(self, filepath: str = "expenses.json") -> None:
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-                self._expenses = [Expense.from_dict(item) for item in data]
-            logger.info(f"Loaded {len(self._expenses)} expenses from {filepath}")
+            mtime_ns = os.stat(filepath).st_mtime_ns
+            if self._matches_file(filepath, mtime_ns):
+                logger.debug("%s unchanged since last load or save", filepath)
+                return
+            with open(filepath, "rb") as f:
+                data = orjson.loads(f.read())
+            # Older snapshots are a bare list, written before log sequencing.
+            if isinstance(data, dict):
+                log_seq, data = data["log_seq"], data["expenses"]
+            else:
+                log_seq = 0
+            expenses = sorted((Expense.from_dict(item) for item in data), key=_date_key)
+            with self._lock:
+                self._expenses = expenses
+                self.log_seq = log_seq
+                self._rebuild_indexes()
+                self._invalidate_cache()
+                self._mark_synced(filepath, mtime_ns, self._version, log_seq)
+            logger.info("Loaded %d expenses from %s", len(self._expenses), filepath)
         except FileNotFoundError:
-            logger.info(f"File {filepath} not found, starting with empty expenses")
-            self._expenses = []
-        except (json.JSONDecodeError, KeyError, ExpenseValidationError) as e:
-            logger.error(f"Failed to load expenses from file: {e}")
+            logger.info("File %s not found, starting with empty expenses", filepath)
+            with self._lock:
+                self._expenses = []
+                self.log_seq = 0
+                self._rebuild_indexes()
+                self._invalidate_cache()
+        except (orjson.JSONDecodeError, KeyError, ExpenseValidationError) as e:
+            logger.error("Failed to load expenses from file: %s", e)
             raise
 
     def clear_all_expenses(self) -> None:
-        count = len(self._expenses)
-        self._expenses.clear()
-        logger.info(f"Cleared {count} expenses")
+        with self._lock:
+            count = len(self._expenses)
+            self._expenses.clear()
+            self._rebuild_indexes()
+            self._invalidate_cache()
+        logger.info("Cleared %d expenses", count)
 
     def get_statistics(self) -> Dict[str, Any]:
+        return self.get_cached("statistics", self._compute_statistics)
+
+    def _compute_statistics(self) -> Dict[str, Any]:
         total = self.get_total_expense()
         by_category = self.get_total_by_category()
         trend = self.get_expense_trend()
@@ -301,6 +753,7 @@ class ExpenseTracker:
             "categories": list(by_category.keys()),
             "category_totals": by_category,
             "expense_trend": trend,
+            "monthly_trend": self.get_monthly_trend(),
             "highest_category": highest,
             "lowest_category": lowest,
         }
@@ -0,0 +1,255 @@
+import logging
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from expenses import Expense, ExpenseTracker, ExpenseValidationError
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_COMPACT = object()
+
+
+class PersistenceWorker:
+    """Persists tracker mutations off the request path.
+
+    Adds and deletes go through the worker, which applies them to the
+    tracker and queues an event. A background thread appends queued
+    events to a JSON Lines log, so a mutation costs one short append
+    instead of a full rewrite. Once the log outgrows twice the snapshot
+    (and at least ``min_compact_bytes``) it is folded back into the
+    snapshot written by ``ExpenseTracker.save_to_file``.
+
+    Each batch of events is written with a single ``os.write``; the log is
+    fsync'd every ``fsync_every`` batches and on shutdown.
+    """
+
+    def __init__(
+        self,
+        tracker: ExpenseTracker,
+        snapshot_path: str = "expenses.json",
+        log_path: str = "expenses.log",
+        min_compact_bytes: int = 64 * 1024,
+        fsync_every: int = 32,
+    ):
+        self.tracker = tracker
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.min_compact_bytes = min_compact_bytes
+        self.fsync_every = fsync_every
+        # Held while the tracker is mutated and the matching event queued,
+        # so a compaction snapshot never races an event into the log.
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._unsynced = 0
+        self._log_size = 0
+        self._snapshot_size = 0
+        # Set when an append fails: the log is missing events the tracker
+        # has, so only a compaction can make the files complete again.
+        self._log_incomplete = False
+        # Sequence number of the last event queued. Records carry it so
+        # replay() can skip those already folded into the snapshot, e.g.
+        # after a crash between writing the snapshot and truncating the log.
+        self._seq = 0
+
+    def add_expense(
+        self,
+        category: str,
+        amount: float,
+        date_str: str,
+        description: Optional[str] = None,
+    ) -> Expense:
+        with self._lock:
+            expense = self.tracker.add_expense(category, amount, date_str, description)
+            self._enqueue("add", expense.to_dict())
+        return expense
+
+    def add_expenses(self, items: List[Dict[str, Any]]) -> List[Expense]:
+        """Add a batch of expenses, logged as a single record."""
+        with self._lock:
+            expenses = self.tracker.add_expenses(items)
+            if expenses:
+                self._enqueue("bulk", [expense.to_dict() for expense in expenses])
+        return expenses
+
+    def remove_by_id(self, expense_id: str) -> Optional[Expense]:
+        with self._lock:
+            expense = self.tracker.remove_by_id(expense_id)
+            if expense is not None:
+                self._enqueue("del", expense_id)
+        return expense
+
+    def _enqueue(self, op: str, payload: Any) -> None:
+        # Callers hold self._lock, which keeps sequence numbers in queue order.
+        self._seq += 1
+        self._queue.put((op, payload, self._seq))
+
+    def replay(self) -> int:
+        """Apply events left in the log by a previous run; returns the count."""
+        try:
+            with open(self.log_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return 0
+
+        lines = raw.splitlines()
+
+        applied = 0
+        for line in lines:
+            try:
+                record = orjson.loads(line)
+                # Records from logs written before sequencing have no seq.
+                seq = record.get("seq")
+                if seq is not None:
+                    self._seq = max(self._seq, seq)
+                    if seq <= self.tracker.log_seq:
+                        continue
+                if record["op"] == "add":
+                    item = record["expense"]
+                    self.tracker.add_expense(
+                        category=item["category"],
+                        amount=item["amount"],
+                        date_str=item["date"],
+                        description=item.get("description"),
+                    )
+                elif record["op"] == "bulk":
+                    self.tracker.add_expenses(record["expenses"])
+                elif record["op"] == "del":
+                    self.tracker.remove_by_id(record["id"])
+                applied += 1
+            except (orjson.JSONDecodeError, KeyError, ExpenseValidationError) as e:
+                # A crash mid-append can leave a torn final line.
+                logger.warning("Skipping unreadable log entry: %s", e)
+        self._log_size = len(raw)
+        logger.info("Replayed %d events from %s", applied, self.log_path)
+        return applied
+
+    def start(self) -> None:
+        self._seq = max(self._seq, self.tracker.log_seq)
+        self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if self._log_size:
+            # Fold the replayed log into the snapshot, dropping any torn tail.
+            self.compact()
+        else:
+            try:
+                self._snapshot_size = os.path.getsize(self.snapshot_path)
+            except OSError:
+                self._snapshot_size = 0
+        self._thread = threading.Thread(
+            target=self._run, name="expense-persistence", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush outstanding events, compact, and stop the worker thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def request_compaction(self) -> None:
+        """Ask the worker to compact as soon as it has drained pending events."""
+        self._queue.put(_COMPACT)
+
+    def compact(self) -> None:
+        """Rewrite the snapshot from the tracker and truncate the log.
+
+        Only called from the worker thread, which owns the log handle.
+        """
+        with self._lock:
+            # Save before touching the queue or the log: if the save fails,
+            # pending events stay queued and the log keeps everything
+            # already appended, so nothing acknowledged is lost.
+            self.tracker.log_seq = self._seq
+            self.tracker.save_to_file(self.snapshot_path)
+            # Everything still queued is already reflected in the tracker,
+            # and so in the snapshot just written.
+            while True:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is _STOP:
+                    self._queue.put(_STOP)
+                    break
+            os.ftruncate(self._fd, 0)
+            self._log_size = 0
+            self._unsynced = 0
+            self._log_incomplete = False
+            self._snapshot_size = os.path.getsize(self.snapshot_path)
+
+    def _should_compact(self) -> bool:
+        return self._log_size > max(2 * self._snapshot_size, self.min_compact_bytes)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            event = self._queue.get()
+            batch = []
+            forced = False
+            while event is not None:
+                if event is _STOP:
+                    stopping = True
+                    break
+                if event is _COMPACT:
+                    forced = True
+                else:
+                    batch.append(event)
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    event = None
+            if batch:
+                self._append(batch)
+
+            if self._log_incomplete or (
+                self._log_size and (stopping or forced or self._should_compact())
+            ):
+                try:
+                    self.compact()
+                except (IOError, OSError) as e:
+                    logger.error("Failed to compact expense log: %s", e)
+
+        if self._unsynced:
+            os.fsync(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+    def _append(self, batch: List[Tuple[str, Any, int]]) -> None:
+        lines = []
+        for op, payload, seq in batch:
+            if op == "add":
+                record = {"seq": seq, "op": op, "expense": payload}
+            elif op == "bulk":
+                record = {"seq": seq, "op": op, "expenses": payload}
+            else:
+                record = {"seq": seq, "op": op, "id": payload}
+            lines.append(orjson.dumps(record))
+        buf = b"\n".join(lines) + b"\n"
+        offset = self._log_size
+        try:
+            written = os.write(self._fd, buf)
+            if written != len(buf):
+                raise OSError(f"short write ({written} of {len(buf)} bytes)")
+            self._log_size += written
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                os.fsync(self._fd)
+                self._unsynced = 0
+        except (IOError, OSError) as e:
+            logger.error("Failed to append to expense log: %s", e)
+            # Drop any partial line so later records stay readable, and
+            # have the worker compact from the tracker, which still holds
+            # the events that did not make it into the log.
+            self._log_incomplete = True
+            try:
+                os.ftruncate(self._fd, offset)
+            except OSError as e:
+                logger.error("Failed to truncate expense log: %s", e)
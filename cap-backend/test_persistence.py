@@ -0,0 +1,98 @@
+import os
+import time
+
+import persistence
+from expenses import ExpenseTracker
+from persistence import PersistenceWorker
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("timed out waiting for the persistence worker")
+
+
+def _wait_for_log_lines(path, count):
+    def enough_lines():
+        with open(path, "rb") as f:
+            return len(f.read().splitlines()) >= count
+
+    _wait_until(enough_lines)
+
+
+def _recover(snapshot_path, log_path):
+    """Rebuild a tracker from the files on disk, as a restart would."""
+    tracker = ExpenseTracker()
+    tracker.load_from_file(snapshot_path)
+    PersistenceWorker(tracker, snapshot_path, log_path).replay()
+    return tracker
+
+
+def test_failed_compaction_keeps_pending_events(tmp_path, monkeypatch):
+    snapshot_path = str(tmp_path / "expenses.json")
+    log_path = str(tmp_path / "expenses.log")
+    tracker = ExpenseTracker()
+    worker = PersistenceWorker(tracker, snapshot_path, log_path)
+
+    # Both adds are acknowledged but still queued when compaction runs.
+    worker.add_expense("Food", 5, "2025-01-01")
+    worker.add_expense("Rent", 900, "2025-01-02")
+
+    def failing_save(filepath):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tracker, "save_to_file", failing_save)
+    try:
+        worker.compact()
+    except OSError:
+        pass
+    monkeypatch.undo()
+
+    worker.start()
+    try:
+        _wait_for_log_lines(log_path, 2)
+        # Simulate a crash: recover from the files as they are right now.
+        recovered = _recover(snapshot_path, log_path)
+        assert sorted(e.id for e in recovered.list_expenses()) == sorted(
+            e.id for e in tracker.list_expenses()
+        )
+    finally:
+        worker.stop()
+
+
+def test_crash_between_snapshot_and_truncate_does_not_duplicate(tmp_path, monkeypatch):
+    snapshot_path = str(tmp_path / "expenses.json")
+    log_path = str(tmp_path / "expenses.log")
+    tracker = ExpenseTracker()
+    worker = PersistenceWorker(tracker, snapshot_path, log_path)
+    worker.start()
+    try:
+        worker.add_expense("Food", 5, "2025-01-01")
+        _wait_for_log_lines(log_path, 1)
+
+        # The snapshot gets written but the log is never truncated, which
+        # leaves the files as a crash right after os.replace would.
+        def failing_ftruncate(fd, length):
+            raise OSError("crashed")
+
+        monkeypatch.setattr(persistence.os, "ftruncate", failing_ftruncate)
+        worker.request_compaction()
+        _wait_until(lambda: os.path.exists(snapshot_path))
+
+        recovered = _recover(snapshot_path, log_path)
+        assert [e.id for e in recovered.list_expenses()] == ["2025-01-01_Food_5.0"]
+
+        # Events logged after the snapshot are still replayed.
+        monkeypatch.undo()
+        worker.add_expense("Rent", 900, "2025-01-02")
+        _wait_for_log_lines(log_path, 2)
+        recovered = _recover(snapshot_path, log_path)
+        assert [e.id for e in recovered.list_expenses()] == [
+            "2025-01-01_Food_5.0",
+            "2025-01-02_Rent_900.0",
+        ]
+    finally:
+        worker.stop()
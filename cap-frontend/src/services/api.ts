@@ -9,9 +9,12 @@ export interface Expense {
 }
 
 export interface Statistics {
-  total_expense: number;
-  total_by_category: Record<string, number>;
+  total_expenses: number;
+  expense_count: number;
+  categories: string[];
+  category_totals: Record<string, number>;
   expense_trend: Record<string, number>;
+  monthly_trend: Record<string, number>;
   highest_category: string | null;
   lowest_category: string | null;
 }